@@ -28,6 +28,8 @@ class Outcome:
         Whether the `current_value` is certain.
     """
 
+    __slots__ = ("__current_value", "__is_certain")
+
     def __init__(self, current_value: bool, is_certain: bool) -> None:
         self.__current_value = current_value
         self.__is_certain = is_certain
@@ -78,3 +80,27 @@ class Outcome:
         """
 
         return self.__is_certain and not self.__current_value
+
+
+_OUTCOMES = {
+    (True, True): Outcome(True, True),
+    (True, False): Outcome(True, False),
+    (False, True): Outcome(False, True),
+    (False, False): Outcome(False, False),
+}
+
+
+def outcome_of(current_value: bool, is_certain: bool) -> Outcome:
+    """
+    Returns the shared `Outcome` for the given `current_value` and `is_certain`.
+    As outcomes are immutable, there is no need to construct a new one every time.
+
+    Parameters
+    ----------
+    current_value
+        The actual result of the test.
+    is_certain
+        Whether the `current_value` is certain.
+    """
+
+    return _OUTCOMES[(bool(current_value), bool(is_certain))]
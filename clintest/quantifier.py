@@ -4,7 +4,7 @@ The abstract class `clintest.quantifier.Quantifier` and classes extending it.
 
 from abc import ABC, abstractmethod
 
-from .outcome import Outcome
+from .outcome import Outcome, outcome_of
 
 
 class Quantifier(ABC):
@@ -46,7 +46,7 @@ class All(Quantifier):
     """
 
     def __init__(self) -> None:
-        self.__state = Outcome(True, False)
+        self.__state = outcome_of(True, False)
 
     def __repr__(self):
         name = self.__class__.__name__
@@ -61,7 +61,7 @@ class All(Quantifier):
 
     def consume(self, value: bool) -> Outcome:
         if not value:
-            self.__state = Outcome(False, True)
+            self.__state = outcome_of(False, True)
         return self.__state
 
 
@@ -71,7 +71,7 @@ class Any(Quantifier):
     """
 
     def __init__(self) -> None:
-        self.__state = Outcome(False, False)
+        self.__state = outcome_of(False, False)
 
     def __repr__(self):
         name = self.__class__.__name__
@@ -86,7 +86,7 @@ class Any(Quantifier):
 
     def consume(self, value: bool) -> Outcome:
         if value:
-            self.__state = Outcome(True, True)
+            self.__state = outcome_of(True, True)
         return self.__state
 
 
@@ -112,7 +112,7 @@ class Exact(Quantifier):
         return f"{self.__class__.__name__} {self.__state}/{self.__target}"
 
     def outcome(self) -> Outcome:
-        return Outcome(self.__state == self.__target, self.__state > self.__target)
+        return outcome_of(self.__state == self.__target, self.__state > self.__target)
 
     def consume(self, value: bool) -> Outcome:
         self.__state += value
@@ -132,7 +132,7 @@ class Finished(Quantifier):
     """
 
     def __init__(self, inner: Quantifier) -> None:
-        self.__state = Outcome(inner.outcome().current_value(), True)
+        self.__state = outcome_of(inner.outcome().current_value(), True)
 
     def __repr__(self):
         name = self.__class__.__name__
@@ -54,16 +54,18 @@ class Clingo(Solver):
         self.__files = [] if files is None else files
 
     def solve(self, test: Test) -> None:
-        ctl = Control(self.__arguments)
+        if not test.outcome().is_certain():
+            ctl = Control(self.__arguments)
 
-        ctl.add("base", [], self.__program)
+            ctl.add("base", [], self.__program)
 
-        for file in self.__files:
-            ctl.load(file)
+            for file in self.__files:
+                ctl.load(file)
 
-        ctl.ground([("base", [])])
+            if self.__program.strip() or self.__files:
+                ctl.ground([("base", [])])
 
-        if not test.outcome().is_certain():
+            # Returning `False` from `on_model` stops the enumeration of further models.
             ctl.solve(
                 on_model=test.on_model,
                 on_unsat=test.on_unsat,
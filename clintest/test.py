@@ -5,12 +5,13 @@ The abstract class `clintest.test.Test` and off-the-shelf test implementations.
 from abc import ABC, abstractmethod
 import os
 from textwrap import indent
-from typing import Any, Callable, Dict, Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from clingo.solving import Model, SolveResult
 from clingo.statistics import StatisticsMap
+from clingo.symbol import Symbol
 
-from .outcome import Outcome
+from .outcome import Outcome, outcome_of
 from .quantifier import Quantifier, Finished
 from .assertion import Assertion
 
@@ -21,6 +22,8 @@ class Test(ABC):
     `clintest.outcome.Outcome`.
     """
 
+    __slots__ = ()
+
     def on_model(self, _model: Model) -> bool:
         """
         Consume a `clingo.model.Model` and possibly alter the current outcome of this test.
@@ -33,9 +36,10 @@ class Test(ABC):
         Returns
         -------
         Whether further models a needed to decide this test.
+        By default, further models are requested as long as the outcome is not certain.
         """
 
-        return True
+        return not self.outcome().is_certain()
 
     def on_unsat(self, lower_bound: Sequence[int]) -> None:
         """
@@ -120,8 +124,10 @@ class True_(Test):
         Whether this test should be lazy, i.e., not consume any models.
     """
 
+    __slots__ = ("__outcome",)
+
     def __init__(self, lazy: bool = True) -> None:
-        self.__outcome = Outcome(True, lazy)
+        self.__outcome = outcome_of(True, lazy)
 
     def __repr__(self):
         name = self.__class__.__name__
@@ -135,7 +141,7 @@ class True_(Test):
         return not self.__outcome.is_certain()
 
     def on_finish(self, result: SolveResult) -> None:
-        self.__outcome = Outcome(True, True)
+        self.__outcome = outcome_of(True, True)
 
     def outcome(self) -> Outcome:
         return self.__outcome
@@ -151,8 +157,10 @@ class False_(Test):
         Whether this test should be lazy, i.e., not consume any models.
     """
 
+    __slots__ = ("__outcome",)
+
     def __init__(self, lazy: bool = True) -> None:
-        self.__outcome = Outcome(False, lazy)
+        self.__outcome = outcome_of(False, lazy)
 
     def __repr__(self):
         name = self.__class__.__name__
@@ -166,18 +174,51 @@ class False_(Test):
         return not self.__outcome.is_certain()
 
     def on_finish(self, result: SolveResult) -> None:
-        self.__outcome = Outcome(False, True)
+        self.__outcome = outcome_of(False, True)
 
     def outcome(self) -> Outcome:
         return self.__outcome
 
 
+class _ModelString:
+    """
+    The string representation of a `clingo.solving.Model` that is only computed if needed.
+    The model itself is only valid during `Test.on_model`, hence its symbols are retrieved eagerly.
+    """
+
+    __slots__ = ("__symbols", "__string")
+
+    def __init__(self, model: Model) -> None:
+        self.__symbols: Optional[Sequence[Symbol]] = model.symbols(shown=True)
+        self.__string: Optional[str] = None
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __str__(self):
+        if self.__string is None:
+            assert self.__symbols is not None
+            self.__string = " ".join(map(str, self.__symbols))
+            self.__symbols = None
+        return self.__string
+
+    def __eq__(self, other):
+        if isinstance(other, (str, _ModelString)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+
 class Recording:
     """
     A recording of the calls to the `on_*`-methods of a `Test`.
     This class is mainly used inside of `Record`.
     """
 
+    __slots__ = ("__entries",)
+
     def __init__(self, entries: Optional[Sequence[Dict[str, Any]]] = None):
         if entries is None:
             entries = []
@@ -191,7 +232,7 @@ class Recording:
         def fmt(entry):
             result = f"[{entry['__outcome']}] {entry['__f']}"
             if entry['__f'] == "on_model":
-                result += os.linesep + 4 * " " + entry['str(model)']
+                result += os.linesep + 4 * " " + str(entry['str(model)'])
             return result
 
         width = len(str(len(self.__entries) - 1))
@@ -240,7 +281,7 @@ class Recording:
 
         # pylint: disable=protected-access
         return len(self.__entries) == len(other.__entries) and all(
-            all(item in other_entry.items() for item in self_entry.items())
+            self_entry.items() <= other_entry.items()
             for self_entry, other_entry in zip(self.__entries, other.__entries)
         )
 
@@ -254,10 +295,16 @@ class Record(Test):
     ----------
     test
         A `Test` that determines how this test should behave.
+
+    enabled
+        Whether calls should be recorded. See `Record.pause` and `Record.resume`.
     """
 
-    def __init__(self, test: Test = True_(lazy = False)):
+    __slots__ = ("test", "recording", "__enabled")
+
+    def __init__(self, test: Test = True_(lazy = False), enabled: bool = True):
         self.test: Test = test
+        self.__enabled = enabled
         self.recording: Recording = Recording([{
             "__f": "__init__",
             "__outcome": self.outcome(),
@@ -267,7 +314,8 @@ class Record(Test):
         name = self.__class__.__name__
         test = repr(self.test)
         recording = repr(self.recording)
-        return f"{name}(test={test}, recording={recording})"
+        enabled = repr(self.__enabled)
+        return f"{name}(test={test}, recording={recording}, enabled={enabled})"
 
     def __str__(self):
         return os.linesep.join([
@@ -277,19 +325,43 @@ class Record(Test):
             indent(str(self.recording), 8 * " "),
         ])
 
+    def pause(self) -> None:
+        """
+        Stop recording calls. Until `Record.resume` is called, this test merely passes all calls on
+        to `test`.
+        """
+
+        self.__enabled = False
+
+    def resume(self) -> None:
+        """
+        Continue recording calls after `Record.pause`.
+        """
+
+        self.__enabled = True
+
     def on_model(self, model: Model) -> bool:
+        if not self.__enabled:
+            return self.test.on_model(model) and not self.outcome().is_certain()
+
         self.recording.append({
             "__f": "on_model",
-            "str(model)": str(model),
+            "str(model)": _ModelString(model),
         })
         result = self.test.on_model(model)
+        outcome = self.outcome()
+        result = result and not outcome.is_certain()
         self.recording.amend({
             "__result": result,
-            "__outcome": self.outcome(),
+            "__outcome": outcome,
         })
         return result
 
     def on_unsat(self, lower_bound: Sequence[int]) -> None:
+        if not self.__enabled:
+            self.test.on_unsat(lower_bound)
+            return
+
         self.recording.append({
             "__f": "on_unsat",
             "lower_bound": lower_bound,
@@ -298,6 +370,10 @@ class Record(Test):
         self.recording.amend({"__outcome": self.outcome()})
 
     def on_core(self, core: Sequence[int]) -> None:
+        if not self.__enabled:
+            self.test.on_core(core)
+            return
+
         self.recording.append({
             "__f": "on_core",
             "core": core,
@@ -306,6 +382,10 @@ class Record(Test):
         self.recording.amend({"__outcome": self.outcome()})
 
     def on_statistics(self, step: StatisticsMap, accumulated: StatisticsMap) -> None:
+        if not self.__enabled:
+            self.test.on_statistics(step, accumulated)
+            return
+
         self.recording.append({
             "__f": "on_statistics",
             "step": step,
@@ -315,6 +395,10 @@ class Record(Test):
         self.recording.amend({"__outcome": self.outcome()})
 
     def on_finish(self, result: SolveResult) -> None:
+        if not self.__enabled:
+            self.test.on_finish(result)
+            return
+
         self.recording.append({
             "__f": "on_finish",
             "result": result,
@@ -341,6 +425,8 @@ class Assert(Test):
         The `clintest.assertion.Assertion` used with this test.
     """
 
+    __slots__ = ("__quantifier", "__assertion")
+
     def __init__(self, quantifier: Quantifier, assertion: Assertion) -> None:
         self.__quantifier = quantifier
         self.__assertion = assertion
@@ -382,8 +468,12 @@ class Not(Test):
         The `Test` to be negated.
     """
 
+    __slots__ = ("__operand", "__operand_outcome", "__outcome")
+
     def __init__(self, operand: Test) -> None:
         self.__operand = operand
+        self.__operand_outcome: Optional[Outcome] = None
+        self.__outcome = outcome_of(False, False)
 
     def __repr__(self):
         name = self.__class__.__name__
@@ -397,7 +487,7 @@ class Not(Test):
         ])
 
     def on_model(self, model: Model) -> bool:
-        return self.__operand.on_model(model)
+        return self.__operand.on_model(model) and not self.outcome().is_certain()
 
     def on_unsat(self, lower_bound: Sequence[int]) -> None:
         self.__operand.on_unsat(lower_bound)
@@ -413,7 +503,10 @@ class Not(Test):
 
     def outcome(self) -> Outcome:
         outcome = self.__operand.outcome()
-        return Outcome(not outcome.current_value(), outcome.is_certain())
+        if outcome is not self.__operand_outcome:
+            self.__operand_outcome = outcome
+            self.__outcome = outcome_of(not outcome.current_value(), outcome.is_certain())
+        return self.__outcome
 
 
 class And(Test):
@@ -435,6 +528,11 @@ class And(Test):
         to test that are already certain.
     """
 
+    __slots__ = (
+        "__operands", "__short_circuit", "__ignore_certain", "__ongoing", "__fast", "__outcome",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         *args: Test,
@@ -446,12 +544,11 @@ class And(Test):
         self.__ignore_certain = ignore_certain
 
         self.__ongoing = list(args)
-        self.__outcome = Outcome(True, False)
-
-        def call_operand(_operand: Test) -> None:
-            pass
+        self.__fast = short_circuit and ignore_certain
+        self.__outcome = outcome_of(True, False)
 
-        self.__on_whatever(call_operand)
+        # Calling the side-effect free `outcome` only evaluates the initial outcomes of the operands.
+        self.__on_whatever("outcome", ())
 
     def __repr__(self):
         name = self.__class__.__name__
@@ -493,59 +590,95 @@ class And(Test):
             f"    ignore_certain: {self.__ignore_certain}",
         ])
 
-    def __on_whatever(self, call_operand: Callable[[Test], None]) -> bool:
-        still_ongoing = []
+    def __on_whatever(self, method: str, args: Tuple[Any, ...]) -> bool:
+        ongoing = self.__ongoing
+        still_ongoing = 0
+        dropped = 0
+
+        try:
+            for operand in ongoing:
+                getattr(operand, method)(*args)
+                outcome = operand.outcome()
+
+                if outcome.is_certainly_false():
+                    if self.__short_circuit:
+                        ongoing.clear()
+                        self.__outcome = outcome_of(False, True)
+                        return False
+                    self.__outcome = outcome_of(False, False)
+
+                if not (self.__ignore_certain and outcome.is_certain()):
+                    ongoing[still_ongoing] = operand
+                    still_ongoing += 1
+                else:
+                    dropped += 1
+        except BaseException:
+            # Close the gap left by the compaction, so that no operand is listed twice.
+            del ongoing[still_ongoing:still_ongoing + dropped]
+            raise
+
+        del ongoing[still_ongoing:]
+        self.__outcome = outcome_of(self.__outcome.current_value(), not still_ongoing)
 
-        for operand in self.__ongoing:
-            call_operand(operand)
+        return not self.__outcome.is_certain()
 
-            if operand.outcome().is_certainly_false():
-                if self.__short_circuit:
-                    self.__ongoing = []
-                    self.__outcome = Outcome(False, True)
+    def __on_whatever_fast(self, method: str, args: Tuple[Any, ...]) -> bool:
+        # `__on_whatever` specialized for `short_circuit` and `ignore_certain`.
+        ongoing = self.__ongoing
+        still_ongoing = 0
+        dropped = 0
+
+        try:
+            for operand in ongoing:
+                getattr(operand, method)(*args)
+                outcome = operand.outcome()
+
+                if not outcome.is_certain():
+                    ongoing[still_ongoing] = operand
+                    still_ongoing += 1
+                elif not outcome.current_value():
+                    ongoing.clear()
+                    self.__outcome = outcome_of(False, True)
                     return False
                 else:
-                    self.__outcome = Outcome(False, False)
+                    dropped += 1
+        except BaseException:
+            # Close the gap left by the compaction, so that no operand is listed twice.
+            del ongoing[still_ongoing:still_ongoing + dropped]
+            raise
 
-            if not (self.__ignore_certain and operand.outcome().is_certain()):
-                still_ongoing.append(operand)
+        del ongoing[still_ongoing:]
+        self.__outcome = outcome_of(self.__outcome.current_value(), not still_ongoing)
 
-        self.__ongoing = still_ongoing
-        self.__outcome = Outcome(self.__outcome.current_value(), not bool(still_ongoing))
-
-        return not self.__outcome.is_certain()
+        return bool(still_ongoing)
 
     def on_model(self, model: Model) -> bool:
-        def call_operand(operand: Test) -> None:
-            operand.on_model(model)
-
-        return self.__on_whatever(call_operand)
+        if self.__fast:
+            return self.__on_whatever_fast("on_model", (model,))
+        return self.__on_whatever("on_model", (model,))
 
     def on_unsat(self, lower_bound: Sequence[int]) -> None:
-        def call_operand(operand: Test) -> None:
-            operand.on_unsat(lower_bound)
-
-        self.__on_whatever(call_operand)
+        if self.__fast:
+            self.__on_whatever_fast("on_unsat", (lower_bound,))
+        else:
+            self.__on_whatever("on_unsat", (lower_bound,))
 
     def on_core(self, core: Sequence[int]) -> None:
-        def call_operand(operand: Test) -> None:
-            operand.on_core(core)
-
-        self.__on_whatever(call_operand)
+        if self.__fast:
+            self.__on_whatever_fast("on_core", (core,))
+        else:
+            self.__on_whatever("on_core", (core,))
 
     def on_statistics(self, step: StatisticsMap, accumulated: StatisticsMap) -> None:
-        def call_operand(operand: Test) -> None:
-            operand.on_statistics(step, accumulated)
-
-        self.__on_whatever(call_operand)
+        if self.__fast:
+            self.__on_whatever_fast("on_statistics", (step, accumulated))
+        else:
+            self.__on_whatever("on_statistics", (step, accumulated))
 
     def on_finish(self, result: SolveResult) -> None:
-        def call_operand(operand: Test) -> None:
-            operand.on_finish(result)
-
         ignore_certain_bck = self.__ignore_certain
         self.__ignore_certain = True
-        self.__on_whatever(call_operand)
+        self.__on_whatever("on_finish", (result,))
         self.__ignore_certain = ignore_certain_bck
 
         assert not self.__ongoing
@@ -574,6 +707,11 @@ class Or(Test):
         to test that are already certain.
     """
 
+    __slots__ = (
+        "__operands", "__short_circuit", "__ignore_certain", "__ongoing", "__fast", "__outcome",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         *args: Test,
@@ -585,12 +723,11 @@ class Or(Test):
         self.__ignore_certain = ignore_certain
 
         self.__ongoing = list(args)
-        self.__outcome = Outcome(False, False)
+        self.__fast = short_circuit and ignore_certain
+        self.__outcome = outcome_of(False, False)
 
-        def call_operand(_operand: Test) -> None:
-            pass
-
-        self.__on_whatever(call_operand)
+        # Calling the side-effect free `outcome` only evaluates the initial outcomes of the operands.
+        self.__on_whatever("outcome", ())
 
     def __repr__(self):
         name = self.__class__.__name__
@@ -632,59 +769,95 @@ class Or(Test):
             f"    ignore_certain: {self.__ignore_certain}",
         ])
 
-    def __on_whatever(self, call_operand: Callable[[Test], None]) -> bool:
-        still_ongoing = []
+    def __on_whatever(self, method: str, args: Tuple[Any, ...]) -> bool:
+        ongoing = self.__ongoing
+        still_ongoing = 0
+        dropped = 0
+
+        try:
+            for operand in ongoing:
+                getattr(operand, method)(*args)
+                outcome = operand.outcome()
+
+                if outcome.is_certainly_true():
+                    if self.__short_circuit:
+                        ongoing.clear()
+                        self.__outcome = outcome_of(True, True)
+                        return False
+                    self.__outcome = outcome_of(True, False)
+
+                if not (self.__ignore_certain and outcome.is_certain()):
+                    ongoing[still_ongoing] = operand
+                    still_ongoing += 1
+                else:
+                    dropped += 1
+        except BaseException:
+            # Close the gap left by the compaction, so that no operand is listed twice.
+            del ongoing[still_ongoing:still_ongoing + dropped]
+            raise
+
+        del ongoing[still_ongoing:]
+        self.__outcome = outcome_of(self.__outcome.current_value(), not still_ongoing)
 
-        for operand in self.__ongoing:
-            call_operand(operand)
+        return not self.__outcome.is_certain()
 
-            if operand.outcome().is_certainly_true():
-                if self.__short_circuit:
-                    self.__ongoing = []
-                    self.__outcome = Outcome(True, True)
+    def __on_whatever_fast(self, method: str, args: Tuple[Any, ...]) -> bool:
+        # `__on_whatever` specialized for `short_circuit` and `ignore_certain`.
+        ongoing = self.__ongoing
+        still_ongoing = 0
+        dropped = 0
+
+        try:
+            for operand in ongoing:
+                getattr(operand, method)(*args)
+                outcome = operand.outcome()
+
+                if not outcome.is_certain():
+                    ongoing[still_ongoing] = operand
+                    still_ongoing += 1
+                elif outcome.current_value():
+                    ongoing.clear()
+                    self.__outcome = outcome_of(True, True)
                     return False
                 else:
-                    self.__outcome = Outcome(True, False)
+                    dropped += 1
+        except BaseException:
+            # Close the gap left by the compaction, so that no operand is listed twice.
+            del ongoing[still_ongoing:still_ongoing + dropped]
+            raise
 
-            if not (self.__ignore_certain and operand.outcome().is_certain()):
-                still_ongoing.append(operand)
+        del ongoing[still_ongoing:]
+        self.__outcome = outcome_of(self.__outcome.current_value(), not still_ongoing)
 
-        self.__ongoing = still_ongoing
-        self.__outcome = Outcome(self.__outcome.current_value(), not bool(still_ongoing))
-
-        return not self.__outcome.is_certain()
+        return bool(still_ongoing)
 
     def on_model(self, model: Model) -> bool:
-        def call_operand(operand: Test) -> None:
-            operand.on_model(model)
-
-        return self.__on_whatever(call_operand)
+        if self.__fast:
+            return self.__on_whatever_fast("on_model", (model,))
+        return self.__on_whatever("on_model", (model,))
 
     def on_unsat(self, lower_bound: Sequence[int]) -> None:
-        def call_operand(operand: Test) -> None:
-            operand.on_unsat(lower_bound)
-
-        self.__on_whatever(call_operand)
+        if self.__fast:
+            self.__on_whatever_fast("on_unsat", (lower_bound,))
+        else:
+            self.__on_whatever("on_unsat", (lower_bound,))
 
     def on_core(self, core: Sequence[int]) -> None:
-        def call_operand(operand: Test) -> None:
-            operand.on_core(core)
-
-        self.__on_whatever(call_operand)
+        if self.__fast:
+            self.__on_whatever_fast("on_core", (core,))
+        else:
+            self.__on_whatever("on_core", (core,))
 
     def on_statistics(self, step: StatisticsMap, accumulated: StatisticsMap) -> None:
-        def call_operand(operand: Test) -> None:
-            operand.on_statistics(step, accumulated)
-
-        self.__on_whatever(call_operand)
+        if self.__fast:
+            self.__on_whatever_fast("on_statistics", (step, accumulated))
+        else:
+            self.__on_whatever("on_statistics", (step, accumulated))
 
     def on_finish(self, result: SolveResult) -> None:
-        def call_operand(operand: Test) -> None:
-            operand.on_finish(result)
-
         ignore_certain_bck = self.__ignore_certain
         self.__ignore_certain = True
-        self.__on_whatever(call_operand)
+        self.__on_whatever("on_finish", (result,))
         self.__ignore_certain = ignore_certain_bck
 
         assert not self.__ongoing
@@ -46,3 +46,27 @@ def test_true_certain():
     assert     outcome.as_tuple() == (True, True)
     assert not outcome.is_certainly_false()
     assert     outcome.is_certainly_true()
+
+
+def test_slots():
+    from clintest.outcome import Outcome
+    outcome = Outcome(True, False)
+
+    assert not hasattr(outcome, "__dict__")
+
+
+def test_outcome_of():
+    from clintest.outcome import Outcome, outcome_of
+
+    for current_value in [False, True]:
+        for is_certain in [False, True]:
+            outcome = outcome_of(current_value, is_certain)
+            assert outcome == Outcome(current_value, is_certain)
+            assert outcome is outcome_of(current_value, is_certain)
+
+
+def test_outcome_of_truthy():
+    from clintest.outcome import outcome_of
+
+    assert outcome_of("yes", None) is outcome_of(True, False)
+    assert outcome_of([], 1) is outcome_of(False, True)
@@ -57,3 +57,17 @@ def test_exact():
         (False, True),
         (False, True),
     ]
+
+
+def test_finished_truthy():
+    from clintest.quantifier import Finished, Quantifier
+    from clintest.outcome import Outcome
+
+    class Truthy(Quantifier):
+        def outcome(self):
+            return Outcome("yes", False)
+
+        def consume(self, value):
+            return self.outcome()
+
+    assert Finished(Truthy()).outcome().as_tuple() == (True, True)
@@ -19,3 +19,94 @@ def test_clingo():
         {'__f': 'on_statistics'},
         {'__f': 'on_finish'},
     ]).subsumes(test.recording)
+
+
+def test_clingo_certain():
+    from clintest.solver import Clingo
+    from clintest.test import Record, Recording, True_
+
+    solver = Clingo("0", "a.", ["this_file_does_not_exist.lp"])
+    test = Record(True_())
+
+    solver.solve(test)
+    assert Recording([
+        {'__f': '__init__'},
+    ]).subsumes(test.recording)
+
+
+def test_clingo_include(tmp_path):
+    from clintest.solver import Clingo
+    from clintest.test import Record, Recording, True_
+
+    main, included = tmp_path / "main.lp", tmp_path / "included.lp"
+    main.write_text(f'#include "{included}".')
+    solver = Clingo("0", files=[str(main)])
+
+    for atom in ["x", "y"]:
+        included.write_text(f"{atom}.")
+        test = Record(True_(lazy=False))
+        solver.solve(test)
+        assert Recording([
+            {'__f': '__init__'},
+            {'__f': 'on_model', 'str(model)': atom},
+            {'__f': 'on_statistics'},
+            {'__f': 'on_finish'},
+        ]).subsumes(test.recording)
+
+
+def test_clingo_repeatable():
+    from clintest.solver import Clingo
+    from clintest.test import Record, True_
+
+    solver = Clingo(
+        ["0", "--opt-mode=opt"],
+        "{p(1..8)}. :- #count{X:p(X)} < 3. #minimize{X,X:p(X)}.",
+    )
+
+    recordings = []
+    for _ in range(3):
+        test = Record(True_(lazy=False))
+        solver.solve(test)
+        recordings.append(str(test.recording))
+
+    assert recordings[0] == recordings[1] == recordings[2]
+
+
+def test_clingo_empty():
+    from clintest.solver import Clingo
+    from clintest.test import Record, Recording, True_
+
+    solver = Clingo("0")
+    test = Record(True_(lazy=False))
+
+    solver.solve(test)
+    assert Recording([
+        {'__f': '__init__'},
+        {'__f': 'on_model', 'str(model)': ''},
+        {'__f': 'on_statistics'},
+        {'__f': 'on_finish'},
+    ]).subsumes(test.recording)
+
+
+def test_clingo_threads():
+    from threading import Thread
+    from clintest.solver import Clingo
+    from clintest.test import Record, Recording, True_
+
+    solver = Clingo("0", "a. {b}.")
+    tests = [Record(True_(lazy=False)) for _ in range(8)]
+    threads = [Thread(target=solver.solve, args=(test,)) for test in tests]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for test in tests:
+        assert test.outcome().is_certainly_true()
+        assert Recording([
+            {'__f': '__init__'},
+            {'__f': 'on_model', 'str(model)': 'a'},
+            {'__f': 'on_model', 'str(model)': 'b a'},
+            {'__f': 'on_statistics'},
+            {'__f': 'on_finish'},
+        ]).subsumes(test.recording)
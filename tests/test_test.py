@@ -376,3 +376,145 @@ def test_or_short_circuit(solver, recording_one_model, recording_two_models):
         {'__f': 'on_model', 'str(model)': 'a'}
     ]).subsumes(inner[0].recording)
     assert recording_two_models.subsumes(inner[1].recording)
+
+
+def test_stop_when_certain(solver, recording_one_model):
+    from clintest.test import Test, Not, Record, Recording
+    from clintest.outcome import Outcome
+
+    class Eager(Test):
+        def __init__(self):
+            self.__outcome = Outcome(False, False)
+            self.models = 0
+
+        def on_model(self, _model):
+            self.__outcome = Outcome(True, True)
+            self.models += 1
+            return True
+
+        def on_finish(self, result):
+            pass
+
+        def outcome(self):
+            return self.__outcome
+
+    test = Record(Eager())
+    solver.solve(test)
+    assert test.outcome().is_certainly_true()
+    assert recording_one_model.subsumes(test.recording)
+    assert Recording([
+        {'__f': '__init__'},
+        {'__f': 'on_model', '__result': False},
+        {'__f': 'on_statistics'},
+        {'__f': 'on_finish'},
+    ]).subsumes(test.recording)
+
+    test = Record(Not(Eager()))
+    solver.solve(test)
+    assert test.outcome().is_certainly_false()
+    assert recording_one_model.subsumes(test.recording)
+
+    eager = Eager()
+    test = Not(eager)
+    solver.solve(test)
+    assert test.outcome().is_certainly_false()
+    assert eager.models == 1
+
+
+def test_record_pause(solver, recording_no_model, recording_two_models):
+    from clintest.test import True_, Record
+
+    test = Record(True_(lazy = False), enabled = False)
+    solver.solve(test)
+    assert test.outcome().is_certainly_true()
+    assert recording_no_model.subsumes(test.recording)
+
+    test = Record(True_(lazy = False))
+    test.pause()
+    test.resume()
+    solver.solve(test)
+    assert test.outcome().is_certainly_true()
+    assert recording_two_models.subsumes(test.recording)
+
+
+def test_record_str(solver):
+    from clintest.test import True_, Record
+
+    test = Record(True_(lazy = False))
+    solver.solve(test)
+    assert "    b a" in str(test.recording)
+    assert "'b a'" in repr(test.recording)
+
+
+def test_slots():
+    from clintest.test import And, Assert, False_, Not, Or, Record, Recording, True_
+    from clintest.quantifier import All
+    from clintest.assertion import Contains
+
+    for test in [
+        True_(),
+        False_(),
+        Record(True_()),
+        Recording(),
+        Assert(All(), Contains("a")),
+        Not(True_()),
+        And(True_()),
+        Or(True_()),
+    ]:
+        assert not hasattr(test, "__dict__")
+
+
+def test_raising_operand():
+    from clintest.test import And, Or, Test
+    from clintest.outcome import Outcome
+
+    class Step(Test):
+        def __init__(self, certain_at=None, raise_at=None, value=True):
+            self.__certain_at = certain_at
+            self.__raise_at = raise_at
+            self.__value = value
+            self.calls = 0
+
+        def on_model(self, _model):
+            self.calls += 1
+            if self.calls == self.__raise_at:
+                raise RuntimeError()
+            return True
+
+        def on_finish(self, result):
+            pass
+
+        def outcome(self):
+            return Outcome(self.__value, self.calls == self.__certain_at)
+
+    for combinator, value in [(And, True), (Or, False)]:
+        for short_circuit in [True, False]:
+            first = Step(certain_at=1, value=value)
+            second = Step(value=value)
+            third = Step(raise_at=1, value=value)
+            test = combinator(first, second, third, short_circuit=short_circuit)
+
+            with pytest.raises(RuntimeError):
+                test.on_model(None)
+            test.on_model(None)
+
+            assert [first.calls, second.calls, third.calls] == [1, 2, 2]
+
+
+def test_no_reference_cycle():
+    import gc
+    import weakref
+    from clintest.test import And, Or, True_
+
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for combinator in [And, Or]:
+            for short_circuit in [True, False]:
+                test = combinator(True_(lazy=False), short_circuit=short_circuit)
+                reference = weakref.ref(test)
+                del test
+                assert reference() is None
+    finally:
+        if enabled:
+            gc.enable()